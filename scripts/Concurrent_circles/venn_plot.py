@@ -24,68 +24,136 @@ Usage example:
 
 from __future__ import annotations
 
+import functools
 import math
-from typing import Dict, Iterable, List, Tuple, Set, FrozenSet
+from typing import Dict, Iterable, List, Tuple, FrozenSet
 
+import numpy as np
 import plotly.graph_objects as go
 
+# Strong, fixed tones for higher contrast
+_COLORS: Dict[str, str] = {
+    "Numeric": "#1E5BFF",      # strong blue
+    "Sequence": "#2E7D32",     # strong green
+    "Categorical": "#C62828",  # strong red
+    "Date": "#5A2ECC",         # strong purple
+}
+
+# Region membership is packed into a 4-bit mask, one bit per data type, so
+# region keys are plain ints. _POPCOUNT gives the region size for each mask.
+_TYPE_BITS: Dict[str, int] = {"Numeric": 1, "Sequence": 2, "Categorical": 4, "Date": 8}
+_POPCOUNT = tuple(bin(mask).count("1") for mask in range(16))
+
+
+def _region_mask(region: Iterable[str]) -> int:
+    return sum(_TYPE_BITS[t] for t in set(region))
+
+
+def _mask_names(mask: int) -> Tuple[str, ...]:
+    return tuple(t for t, bit in _TYPE_BITS.items() if mask & bit)
+
+
+# Circle layout (centers and a common radius) tuned to resemble the sample
+# image while leaving room for clear labels.
+_RADIUS = 4.15
+_BASE_CENTERS: Tuple[Tuple[str, Tuple[float, float]], ...] = (
+    ("Numeric", (3.3, 6.3)),
+    ("Sequence", (7.0, 6.2)),
+    ("Categorical", (6.0, 3.2)),
+    ("Date", (3.1, 3.3)),
+)
+
+# Labels with hand-tuned coordinates to reflect the overlaps as shown in the
+# reference image, in axis units, each with the mask of its owning region. The
+# membership keeps labels in the correct overlap even when shared_region is
+# large.
+_BASE_LABELS: Tuple[Tuple[str, Tuple[float, float], int], ...] = tuple(
+    (text, xy, _region_mask(region))
+    for text, xy, region in [
+        # Global / multi-type metrics (central region)
+        ("Description", (5.0, 5.2), {"Numeric", "Sequence", "Categorical", "Date"}),
+        ("Missing Percentage", (5.7, 4.7), {"Numeric", "Sequence", "Categorical", "Date"}),
+        ("Samples", (4.6, 5.4), {"Numeric", "Sequence", "Categorical", "Date"}),
+        ("Most Frequent Values", (5.0, 3.9), {"Numeric", "Sequence", "Categorical", "Date"}),
+        ("Cardinality", (6.1, 4.2), {"Numeric", "Sequence", "Categorical", "Date"}),
+        ("Uniqueness Ratio", (5.0, 3.3), {"Numeric", "Sequence", "Categorical", "Date"}),
 
-def _add_circle(
-    fig: go.Figure,
-    center: Tuple[float, float],
-    radius: float,
-    fillcolor: str,
-    opacity: float,
-    line_color: str,
-) -> None:
-    """Add a circle shape to a Plotly figure.
+        # Numeric-only (left/top zones)
+        ("Quantiles", (3.8, 8.1), {"Numeric"}),
+        ("Average Value", (2.6, 6.7), {"Numeric"}),
 
-    The circle is defined in data coordinates using the equation-based ellipse
-    parameters (x0, y0, x1, y1) where x0/y0 and x1/y1 represent the bounding
-    box corners.
-    """
+        # Sequence-only
+        ("Maximum Length", (8.1, 7.2), {"Sequence"}),
+        ("Mean Length", (8.5, 5.3), {"Sequence"}),
+        ("Minimum Length", (6.7, 8.7), {"Sequence"}),
 
-    cx, cy = center
-    fig.add_shape(
-        type="circle",
-        xref="x",
-        yref="y",
-        x0=cx - radius,
-        y0=cy - radius,
-        x1=cx + radius,
-        y1=cy + radius,
-        line=dict(color=line_color, width=3),
-        fillcolor=fillcolor,
-        opacity=opacity,
-        layer="below",
-    )
+        # Numeric ∩ Sequence
+        ("Frequency", (5.5, 6.8), {"Numeric", "Sequence"}),
+        ("Uniformity", (5.8, 7.6), {"Numeric", "Sequence"}),
 
+        # Sequence ∩ Categorical
+        ("Unique Count", (6.5, 6.8), {"Numeric", "Sequence"}),
 
-def _add_text_points(
-    fig: go.Figure,
-    labels: Iterable[Tuple[str, float, float]],
-    font_size: int,
-) -> None:
-    """Add text-only scatter points.
+        # Numeric ∩ Date (left/bottom region)
+        ("Minimum Value", (2.0, 4.6), {"Numeric", "Date"}),
+        ("Maximum Value", (2.6, 2.9), {"Numeric", "Date"}),
+
+        # Categorical ∩ Date (bottom center)
+        ("Distribution", (5.0, 1.9), {"Categorical", "Date"}),
+    ]
+)
+
+# Region-size dependent minimum radial factors (1- to 4-way regions) that
+# keep labels from collapsing into the center when shared_region is large.
+_MIN_FACTOR_BY_SIZE = (0.90, 0.70, 0.55, 0.35)
+
+# Corner badges for the circle names as (name, paper x, paper y); the top
+# badges are swapped to match left/right semantics.
+_BADGES: Tuple[Tuple[str, float, float], ...] = (
+    ("Numeric", 0.08, 0.95),
+    ("Sequence", 0.92, 0.95),
+    ("Categorical", 0.92, 0.06),
+    ("Date", 0.08, 0.06),
+)
 
-    Each label tuple is (text, x, y).
+
+class _LabelGrid:
+    """Uniform hash grid over the 10x10 canvas holding placed label indices.
+
+    Each label is registered in the 3x3 block of cells around its centre, so
+    the slot list of a point's own cell names every label closer than one
+    cell width. With the cell at least as wide as the largest clearance any
+    pair can require, that list is all an overlap test needs to look at.
     """
 
-    if not labels:
-        return
-
-    fig.add_trace(
-        go.Scatter(
-            x=[x for _, x, _ in labels],
-            y=[y for _, _, y in labels],
-            text=[t for t, _, _ in labels],
-            mode="text",
-            textposition="middle center",
-            textfont=dict(size=font_size, color="#1f1f1f"),
-            hoverinfo="text",
-            showlegend=False,
-        )
-    )
+    def __init__(self, cell: float) -> None:
+        self.cell = cell
+        self.size = int(10.0 / cell) + 3
+        self.slots = np.full((self.size, self.size, 4), -1, dtype=np.int32)
+        self.count = np.zeros((self.size, self.size), dtype=np.int32)
+
+    def _cells(self, x, y):
+        ix = np.clip(np.floor(np.asarray(x) / self.cell).astype(np.intp) + 1, 0, self.size - 1)
+        iy = np.clip(np.floor(np.asarray(y) / self.cell).astype(np.intp) + 1, 0, self.size - 1)
+        return ix, iy
+
+    def insert(self, idx: int, x: float, y: float) -> None:
+        ix, iy = self._cells(x, y)
+        lo_x, hi_x = max(ix - 1, 0), min(ix + 2, self.size)
+        lo_y, hi_y = max(iy - 1, 0), min(iy + 2, self.size)
+        count = self.count[lo_x:hi_x, lo_y:hi_y]
+        if count.max() == self.slots.shape[2]:
+            grown = np.full(self.slots.shape[:2] + (2 * self.slots.shape[2],), -1, dtype=np.int32)
+            grown[:, :, : self.slots.shape[2]] = self.slots
+            self.slots = grown
+        gx, gy = np.mgrid[lo_x:hi_x, lo_y:hi_y]
+        self.slots[gx, gy, count] = idx
+        count += 1
+
+    def neighbours(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Indices registered in each point's cell, padded with -1."""
+        ix, iy = self._cells(x, y)
+        return self.slots[ix, iy, : self.count.max()]
 
 
 def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
@@ -97,90 +165,338 @@ def _rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     return '#%02x%02x%02x' % rgb
 
 
-def _blend_colors(hex_colors: List[str]) -> str:
-    if not hex_colors:
+# Per-type RGB channels, parsed once so blending never touches hex strings.
+_RGB_TABLE: Dict[str, np.ndarray] = {
+    name: np.array(_hex_to_rgb(hex_color), dtype=np.uint16) for name, hex_color in _COLORS.items()
+}
+
+
+def _blend_colors(names: Iterable[str]) -> str:
+    """Average the colors of the given data types into a single hex color."""
+    rgbs = [_RGB_TABLE[t] for t in names]
+    if not rgbs:
         return '#1f1f1f'
-    rs, gs, bs = 0, 0, 0
-    for h in hex_colors:
-        r, g, b = _hex_to_rgb(h)
-        rs += r
-        gs += g
-        bs += b
-    n = len(hex_colors)
-    return _rgb_to_hex((int(rs / n), int(gs / n), int(bs / n)))
-
-
-def _darken_hex(hex_color: str, factor: float) -> str:
-    factor = max(0.0, min(1.0, float(factor)))
-    r, g, b = _hex_to_rgb(hex_color)
-    r = int(r * factor)
-    g = int(g * factor)
-    b = int(b * factor)
-    return _rgb_to_hex((r, g, b))
-
-
-def _avoid_label_overlap(
-    labels: List[Tuple[str, float, float]],
-    anchors: List[Tuple[float, float]],
-    font_size: int,
-    iterations: int = 220,
-    step: float = 0.07,
-    x_bounds: Tuple[float, float] = (0.4, 9.6),
-    y_bounds: Tuple[float, float] = (0.4, 9.6),
-    clusters: List[FrozenSet[str]] | None = None,
-    cluster_penalty: float = 2.0,
-    anchor_strength: float = 0.04,
-) -> List[Tuple[str, float, float]]:
-    """Iteratively repel labels to reduce overlaps while keeping them near anchors.
+    rgb = np.stack(rgbs).mean(axis=0).astype(np.uint8)
+    return _rgb_to_hex(tuple(int(c) for c in rgb))  # type: ignore
+
+
+def _classify_numpy(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    cx: np.ndarray,
+    cy: np.ndarray,
+    bits: np.ndarray,
+    radius: float,
+    in_code: np.ndarray,
+    on_code: np.ndarray,
+    margin: np.ndarray,
+) -> None:
+    """Classify the grid ``xs`` x ``ys`` against the circles, in place.
 
-    Uses a simple force-based relaxation that treats each label as a disk with
-    a radius roughly proportional to its text length and font size. This is a
-    heuristic; it prioritizes legibility and stability over geometric precision.
+    For every point ``in_code`` gets the bits of the circles strictly
+    containing it, ``on_code`` those of the circles whose boundary it lies
+    on, and ``margin`` its clearance to the nearest boundary it is not on.
     """
 
-    texts = [t for t, _, _ in labels]
-    xs = [x for _, x, _ in labels]
-    ys = [y for _, _, y in labels]
+    radius2 = radius * radius
+    for t in range(len(cx)):
+        d2 = (xs[:, None] - cx[t]) ** 2 + (ys[None, :] - cy[t]) ** 2
+        inside = d2 < radius2
+        on = d2 == radius2
+        np.bitwise_or(in_code, bits[t], out=in_code, where=inside)
+        np.bitwise_or(on_code, bits[t], out=on_code, where=on)
+        clearance = np.sqrt(d2, out=d2)
+        clearance -= radius
+        np.negative(clearance, out=clearance, where=inside)
+        np.minimum(margin, clearance, out=margin, where=~on)
+
+
+def _compute_region_candidates(
+    grid_step: float,
+    radius: float,
+    centers_key: Tuple[Tuple[str, float, float], ...],
+    regions_key: FrozenSet[int],
+) -> Dict[int, np.ndarray]:
+    """Sample the [0, 10] x [0, 10] canvas and collect candidate points per region.
+
+    ``centers_key`` holds ``(name, cx, cy)`` for every circle and
+    ``regions_key`` the region masks to sample. Each region maps to a
+    (K, 3) array of (x, y, margin) where margin is the clearance to the nearest
+    circle boundary, sorted so interior points come first.
+
+    Floats are rounded to 6 decimals before sampling, so geometries that only
+    differ by floating-point noise (e.g. across a ``shared_region`` sweep or
+    between the two backends) share one memoized result. The arrays are
+    read-only views into that cache.
+    """
+
+    return dict(
+        _region_candidates_cached(
+            round(grid_step, 6),
+            round(radius, 6),
+            tuple((name, round(cx, 6), round(cy, 6)) for name, cx, cy in centers_key),
+            regions_key,
+        )
+    )
+
+
+def clear_cache() -> None:
+    """Drop the memoized region candidates."""
+
+    _region_candidates_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _region_candidates_cached(
+    grid_step: float,
+    radius: float,
+    centers_key: Tuple[Tuple[str, float, float], ...],
+    regions_key: FrozenSet[int],
+) -> Dict[int, np.ndarray]:
+
+    # Candidate grid. ``indexing="ij"`` keeps x as the outer axis so flattened
+    # points come out in the same order as a nested x/y scan.
+    step = max(0.01, float(grid_step))  # grid step in axis units
+    grid = step * np.arange(int(10.0 / step) + 1)
+    radius2 = radius * radius
+
+    # Coarse pass on a lattice 8x sparser to find each region's bounding box.
+    # Included circles are grown and excluded ones shrunk by half a coarse cell
+    # diagonal, so every fine point of a region is within half a cell of a
+    # coarse hit and the padded box below cannot clip the region.
+    coarse = 8.0 * step
+    coarse_grid = coarse * np.arange(int(10.0 / coarse) + 2)
+    CX, CY = np.meshgrid(coarse_grid, coarse_grid, indexing="ij")
+    slack = coarse * math.sqrt(0.5)
+    coarse_in2 = (radius + slack) ** 2
+    coarse_out2 = max(0.0, radius - slack) ** 2
+    coarse_dist2_to = {name: (CX - cx) ** 2 + (CY - cy) ** 2 for name, cx, cy in centers_key}
+
+    # Names of the circles each region lies inside and outside of.
+    inside = {ky: [t for t in coarse_dist2_to if _TYPE_BITS[t] & ky] for ky in regions_key}
+    outside = {ky: [t for t in coarse_dist2_to if not _TYPE_BITS[t] & ky] for ky in regions_key}
+    region_to_points: Dict[int, np.ndarray] = {}
+    boxes: Dict[int, Tuple[int, int, int, int]] = {}
+    for ky in regions_key:
+        coarse_mask = np.logical_and.reduce(
+            [coarse_dist2_to[t] <= coarse_in2 for t in inside[ky]]
+            + [coarse_dist2_to[t] >= coarse_out2 for t in outside[ky]]
+        )
+        if not coarse_mask.any():
+            region_to_points[ky] = np.empty((0, 3))
+            region_to_points[ky].flags.writeable = False
+            continue
+        hits_x, hits_y = CX[coarse_mask], CY[coarse_mask]
+        i0 = max(0, int(math.floor((hits_x.min() - coarse) / step)))
+        i1 = min(len(grid) - 1, int(math.ceil((hits_x.max() + coarse) / step)))
+        j0 = max(0, int(math.floor((hits_y.min() - coarse) / step)))
+        j1 = min(len(grid) - 1, int(math.ceil((hits_y.max() + coarse) / step)))
+        # The padding above can overshoot; a point outside the bounding box of
+        # any included circle can never be inside it, so trim to those boxes.
+        for name, cx, cy in centers_key:
+            if name in inside[ky]:
+                i0 = max(i0, int(math.floor((cx - radius) / step)))
+                i1 = min(i1, int(math.ceil((cx + radius) / step)))
+                j0 = max(j0, int(math.floor((cy - radius) / step)))
+                j1 = min(j1, int(math.ceil((cy + radius) / step)))
+        if i0 > i1 or j0 > j1:
+            region_to_points[ky] = np.empty((0, 3))
+            region_to_points[ky].flags.writeable = False
+            continue
+        boxes[ky] = (i0, i1, j0, j1)
+    if not boxes:
+        return region_to_points
+
+    # Fine pass. Every point of the union of the bounding boxes is classified
+    # once against all circles; each region then works on a view of its box.
+    u0 = min(b[0] for b in boxes.values())
+    u1 = max(b[1] for b in boxes.values())
+    v0 = min(b[2] for b in boxes.values())
+    v1 = max(b[3] for b in boxes.values())
+    xs, ys = grid[u0:u1 + 1], grid[v0:v1 + 1]
+    in_code = np.zeros((len(xs), len(ys)), dtype=np.uint8)
+    on_code = np.zeros((len(xs), len(ys)), dtype=np.uint8)
+    margin = np.full((len(xs), len(ys)), np.inf)
+    _classify_numpy(
+        xs, ys,
+        np.array([cx for _, cx, _ in centers_key]),
+        np.array([cy for _, _, cy in centers_key]),
+        np.array([_TYPE_BITS[t] for t, _, _ in centers_key], dtype=np.uint8),
+        float(radius), in_code, on_code, margin,
+    )
+    # Clearance credited to a boundary a point lies on: +edge if the region
+    # is inside that circle, -edge if outside (edge is 0 or a rounding ulp).
+    edge = radius - math.sqrt(radius2)
+
+    for ky, (i0, i1, j0, j1) in boxes.items():
+        window = (slice(i0 - u0, i1 - u0 + 1), slice(j0 - v0, j1 - v0 + 1))
+        # A point lies in the region if no circle outside it strictly contains
+        # the point and every circle of the region contains it or passes
+        # through it.
+        box_in, box_on = in_code[window], on_code[window]
+        mask = ((box_in & (15 ^ ky)) == 0) & (((box_in | box_on) & ky) == ky)
+        ii, jj = np.nonzero(mask)
+        m = margin[window][mask]
+        on = box_on[mask]
+        if on.any():
+            m = np.where(on & ky, np.minimum(m, edge), m)
+            m = np.where(on & (15 ^ ky), np.minimum(m, -edge), m)
+        order = np.argsort(-m, kind="stable")
+        points = np.column_stack((xs[i0 - u0:][ii[order]], ys[j0 - v0:][jj[order]], m[order]))
+        points.flags.writeable = False
+        region_to_points[ky] = points
+    return region_to_points
+
+
+def _spacing_by_size(
+    region_spacing: float,
+    spacing_1way: float,
+    spacing_2way: float,
+    spacing_3way: float,
+    spacing_4way: float,
+) -> Tuple[float, float, float, float]:
+    """Extra spacing between labels of the same 1- to 4-way region.
+
+    Explicit per-size values are used when non-negative; otherwise they fall
+    back to the global ``region_spacing`` scaled by region size.
+    """
+
+    base_spacing = max(0.0, region_spacing)
+    return (
+        spacing_1way if spacing_1way >= 0.0 else 0.40 * base_spacing,
+        spacing_2way if spacing_2way >= 0.0 else 0.60 * base_spacing,
+        spacing_3way if spacing_3way >= 0.0 else 0.75 * base_spacing,
+        spacing_4way if spacing_4way >= 0.0 else 1.00 * base_spacing,
+    )
+
+
+def _label_radii(texts: Iterable[str], font_size: int) -> np.ndarray:
+    """Disk radius each label needs, from its text length and the font size."""
 
     scale = max(0.5, min(2.0, font_size / 26.0))
-    radii = [0.12 * scale + 0.006 * len(t) * scale for t in texts]
-
-    for _ in range(max(0, iterations)):
-        # pairwise repulsion
-        for i in range(len(xs)):
-            for j in range(i + 1, len(xs)):
-                dx = xs[i] - xs[j]
-                dy = ys[i] - ys[j]
-                dist2 = dx * dx + dy * dy
-                min_d = radii[i] + radii[j]
-                # Inflate required spacing for labels from different clusters
-                if clusters is not None and clusters[i] != clusters[j]:
-                    min_d *= 1.0 + 0.08 * max(0.0, cluster_penalty)
-                if dist2 == 0.0:
-                    dx, dy = 0.001, 0.0
-                    dist2 = dx * dx + dy * dy
-                dist = dist2 ** 0.5
-                if dist < min_d:
-                    push = (min_d - dist) / max(min_d, 1e-6)
-                    # Amplify repulsion for labels from different clusters
-                    if clusters is not None and clusters[i] != clusters[j]:
-                        push *= max(1.0, cluster_penalty)
-                    ux = dx / dist
-                    uy = dy / dist
-                    xs[i] += ux * step * push
-                    ys[i] += uy * step * push
-                    xs[j] -= ux * step * push
-                    ys[j] -= uy * step * push
-
-        # gentle pull back to anchors and clamp to bounds
-        for i in range(len(xs)):
-            ax, ay = anchors[i]
-            xs[i] += (ax - xs[i]) * anchor_strength
-            ys[i] += (ay - ys[i]) * anchor_strength
-            xs[i] = max(x_bounds[0], min(x_bounds[1], xs[i]))
-            ys[i] = max(y_bounds[0], min(y_bounds[1], ys[i]))
-
-    return [(texts[i], xs[i], ys[i]) for i in range(len(xs))]
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int32)
+    return 0.12 * scale + 0.007 * lengths * scale
+
+
+def _place_labels(
+    labels: List[Tuple[str, float, float]],
+    label_clusters: List[int],
+    radii: np.ndarray,
+    region_to_points: Dict[int, np.ndarray],
+    spacing_by_size: Tuple[float, float, float, float],
+    padding: float,
+) -> List[Tuple[str, float, float]]:
+    """Greedily move each label to the best candidate point of its region.
+
+    Regions are filled from the most to the least shared. A candidate must
+    keep the label disk ``padding`` inside the region and clear every placed
+    label (plus the per-size spacing within a region); among those, the one
+    maximizing margin + 0.5 * min_dist wins. Labels of regions without any
+    candidate keep their anchor, and labels that fit nowhere take the
+    region's top-margin point.
+    """
+
+    # Placed labels are kept as parallel arrays (x, y, radius, region id)
+    # filled up to n_placed.
+    n_labels = len(labels)
+    placed_x = np.empty(n_labels)
+    placed_y = np.empty(n_labels)
+    placed_r = np.empty(n_labels)
+    placed_key_id = np.empty(n_labels, dtype=np.int32)
+    n_placed = 0
+    new_labels: List[Tuple[str, float, float]] = [(t, 0.0, 0.0) for t, _, _ in labels]
+
+    # indices grouped by region size high -> low to fill central first
+    indices_by_key: Dict[int, List[int]] = {}
+    for idx, key in enumerate(label_clusters):
+        indices_by_key.setdefault(key, []).append(idx)
+    ordered_keys = sorted(indices_by_key.keys(), key=lambda k: (-_POPCOUNT[k], sorted(_mask_names(k))))
+    key_ids = {key: kid for kid, key in enumerate(ordered_keys)}
+
+    padding = float(padding)
+    # Any clearance is at most two radii plus the widest spacing (with a hair
+    # of room for rounding), so cells that wide keep every possible overlap
+    # inside a 3x3 neighbourhood.
+    grid = _LabelGrid(max(2.0 * float(radii.max()) + max(spacing_by_size), 0.05) + 1e-6)
+
+    for key in ordered_keys:
+        idxs = indices_by_key[key]
+        key_id = key_ids[key]
+        same_region_extra = spacing_by_size[_POPCOUNT[key] - 1]
+        candidates = region_to_points.get(key)
+        if candidates is None or len(candidates) == 0:
+            # Fallback to previous anchor if region has no area (rare)
+            for i in idxs:
+                text, ax, ay = labels[i]
+                new_labels[i] = (text, ax, ay)
+                placed_x[n_placed], placed_y[n_placed] = ax, ay
+                grid.insert(n_placed, ax, ay)
+                placed_r[n_placed], placed_key_id[n_placed] = radii[i], key_id
+                n_placed += 1
+            continue
+        # try to place labels greedily
+        for i in idxs:
+            text = labels[i][0]
+            r_need = float(radii[i])
+            chosen = None
+            # ensure the label disk fits fully in region by margin
+            feasible = candidates[candidates[:, 2] >= r_need + padding]
+            if len(feasible) and n_placed:
+                req_all = placed_r[:n_placed] + r_need + np.where(
+                    placed_key_id[:n_placed] == key_id, same_region_extra, 0.0
+                )
+                # Broad phase: only labels sharing a candidate's grid cell can
+                # overlap it, so the overlap test reads just those slots.
+                nbrs = grid.neighbours(feasible[:, 0], feasible[:, 1])
+                listed = nbrs >= 0
+                nbrs = np.where(listed, nbrs, 0)
+                dists = np.sqrt(
+                    (feasible[:, 0, None] - placed_x[nbrs]) ** 2
+                    + (feasible[:, 1, None] - placed_y[nbrs]) ** 2
+                )
+                slack = np.where(listed, dists - req_all[nbrs], np.inf)
+                ok = ~np.any(slack < 0.0, axis=1)
+                min_dist = slack.min(axis=1, initial=np.inf)
+                # Unlisted labels sit more than a cell away, so the local
+                # minimum is exact unless it exceeds that floor. Where it does,
+                # the newest label still bounds the score from above, and only
+                # candidates whose bound can beat the best exact score so far
+                # are checked against every label.
+                far = ok & (min_dist > grid.cell - req_all.max())
+                if far.any():
+                    last = n_placed - 1
+                    bound = np.minimum(min_dist, np.hypot(
+                        feasible[:, 0] - placed_x[last], feasible[:, 1] - placed_y[last]
+                    ) - req_all[last])
+                    exact = ok & ~far
+                    best_exact = (feasible[exact, 2] + 0.5 * min_dist[exact]).max(initial=-np.inf)
+                    hopeless = far & (feasible[:, 2] + 0.5 * bound < best_exact)
+                    min_dist[hopeless] = -np.inf
+                    far &= ~hopeless
+                    dx = feasible[far, 0, None] - placed_x[:n_placed]
+                    dy = feasible[far, 1, None] - placed_y[:n_placed]
+                    min_dist[far] = np.min(np.sqrt(dx * dx + dy * dy) - req_all, axis=1)
+                score = np.where(ok, feasible[:, 2] + 0.5 * min_dist, -np.inf)
+                # ties go to the candidate with the larger margin, i.e. the one
+                # that comes first in the margin-sorted list (argmax keeps it)
+                best_idx = int(np.argmax(score))
+                if ok[best_idx]:
+                    chosen = (float(feasible[best_idx, 0]), float(feasible[best_idx, 1]))
+            elif len(feasible):
+                # nothing placed yet: the best-margin candidate wins outright
+                chosen = (float(feasible[0, 0]), float(feasible[0, 1]))
+            if chosen is None:
+                # relax constraint: take top-margin candidate even if overlaps slightly
+                px, py, _ = candidates[0].tolist()
+            else:
+                px, py = chosen
+            new_labels[i] = (text, px, py)
+            placed_x[n_placed], placed_y[n_placed] = px, py
+            grid.insert(n_placed, px, py)
+            placed_r[n_placed], placed_key_id[n_placed] = r_need, key_id
+            n_placed += 1
+
+    return new_labels
 
 
 def create_concurrent_circles_figure(
@@ -225,98 +541,45 @@ def create_concurrent_circles_figure(
     x_range = (0.0, 10.0)
     y_range = (0.0, 10.0)
 
-    # Circle layout (centers and a common radius) tuned to resemble the sample
-    # image while leaving room for clear labels.
-    radius = 4.15
-    base_centers = {
-        "Numeric": (3.3, 6.3),
-        "Sequence": (7.0, 6.2),
-        "Categorical": (6.0, 3.2),
-        "Date": (3.1, 3.3),
-    }
-
-    # Strong, fixed tones for higher contrast
-    colors = {
-        "Numeric": "#1E5BFF",      # strong blue
-        "Sequence": "#2E7D32",     # strong green
-        "Categorical": "#C62828",  # strong red
-        "Date": "#5A2ECC",         # strong purple
-    }
+    radius = _RADIUS
 
     # Interpolate centers toward their centroid based on shared_region in [0, 1]
     shared_region = max(0.0, min(1.0, shared_region))
-    centroid_x = sum(c[0] for c in base_centers.values()) / 4.0
-    centroid_y = sum(c[1] for c in base_centers.values()) / 4.0
+    centroid_x = sum(c[0] for _, c in _BASE_CENTERS) / 4.0
+    centroid_y = sum(c[1] for _, c in _BASE_CENTERS) / 4.0
     centers = {}
-    for name, (cx, cy) in base_centers.items():
+    for name, (cx, cy) in _BASE_CENTERS:
         nx = centroid_x + (cx - centroid_x) * (1.0 - shared_region)
         ny = centroid_y + (cy - centroid_y) * (1.0 - shared_region)
         centers[name] = (nx, ny)
 
-    fig = go.Figure()
-
-    # Draw the four circles
-    for name in ["Numeric", "Sequence", "Categorical", "Date"]:
-        _add_circle(
-            fig,
-            center=centers[name],
-            radius=radius,
-            fillcolor=colors[name],
+    # The four circles, as plain layout-shape dicts in data coordinates
+    shapes = [
+        dict(
+            type="circle",
+            xref="x",
+            yref="y",
+            x0=centers[name][0] - radius,
+            y0=centers[name][1] - radius,
+            x1=centers[name][0] + radius,
+            y1=centers[name][1] + radius,
+            line=dict(color=_COLORS[name], width=3),
+            fillcolor=_COLORS[name],
             opacity=circle_opacity,
-            line_color=colors[name],
+            layer="below",
         )
-
-    # Labels with hand-tuned coordinates to reflect the overlaps as shown
-    # in the reference image. Coordinates are in the same units as the axes.
-    # Define base labels with their owning region membership. The membership is
-    # used to keep labels in the correct overlap even when shared_region is large.
-    LabelInfo = Tuple[str, Tuple[float, float], Set[str]]
-    base_labels: List[LabelInfo] = [
-        # Global / multi-type metrics (central region)
-        ("Description", (5.0, 5.2), {"Numeric", "Sequence", "Categorical", "Date"}),
-        ("Missing Percentage", (5.7, 4.7), {"Numeric", "Sequence", "Categorical", "Date"}),
-        ("Samples", (4.6, 5.4), {"Numeric", "Sequence", "Categorical", "Date"}),
-        ("Most Frequent Values", (5.0, 3.9), {"Numeric", "Sequence", "Categorical", "Date"}),
-        ("Cardinality", (6.1, 4.2), {"Numeric", "Sequence", "Categorical", "Date"}),
-        ("Uniqueness Ratio", (5.0, 3.3), {"Numeric", "Sequence", "Categorical", "Date"}),
-
-        # Numeric-only (left/top zones)
-        ("Quantiles", (3.8, 8.1), {"Numeric"}),
-        ("Average Value", (2.6, 6.7), {"Numeric"}),
-
-        # Sequence-only
-        ("Maximum Length", (8.1, 7.2), {"Sequence"}),
-        ("Mean Length", (8.5, 5.3), {"Sequence"}),
-        ("Minimum Length", (6.7, 8.7), {"Sequence"}),
-
-        # Numeric ∩ Sequence
-        ("Frequency", (5.5, 6.8), {"Numeric", "Sequence"}),
-        ("Uniformity", (5.8, 7.6), {"Numeric", "Sequence"}),
-
-        # Sequence ∩ Categorical
-        ("Unique Count", (6.5, 6.8), {"Numeric", "Sequence"}),
-
-        # Numeric ∩ Date (left/bottom region)
-        ("Minimum Value", (2.0, 4.6), {"Numeric", "Date"}),
-        ("Maximum Value", (2.6, 2.9), {"Numeric", "Date"}),
-
-        # Categorical ∩ Date (bottom center)
-        ("Distribution", (5.0, 1.9), {"Categorical", "Date"}),
+        for name in ["Numeric", "Sequence", "Categorical", "Date"]
     ]
 
+    radii = _label_radii((t for t, _, _ in _BASE_LABELS), font_size)
+
     # Compute label positions that stay in their intended regions.
     labels: List[Tuple[str, float, float]] = []
     label_anchors: List[Tuple[float, float]] = []
-    label_clusters: List[FrozenSet[str]] = []
-    all_types = {"Numeric", "Sequence", "Categorical", "Date"}
-    # Region-size dependent minimum radial factors to prevent collapsing
-    # into the center when shared_region is large.
-    min_factor_by_size = {1: 0.90, 2: 0.70, 3: 0.55, 4: 0.35}
+    label_clusters: List[int] = []
 
-    for text, (lx, ly), region in base_labels:
-        region_size = len(region)
-        min_factor = min_factor_by_size.get(region_size, 0.6)
-        factor = max(min_factor, 1.0 - shared_region)
+    for text, (lx, ly), mask in _BASE_LABELS:
+        factor = max(_MIN_FACTOR_BY_SIZE[_POPCOUNT[mask] - 1], 1.0 - shared_region)
 
         # Compute position by pulling the original base label toward centroid
         # with a factor that depends on membership size.
@@ -327,163 +590,71 @@ def create_concurrent_circles_figure(
         # will resolve any residual overlaps while keeping labels near anchors.
         labels.append((text, nx, ny))
         label_anchors.append((nx, ny))
-        label_clusters.append(frozenset(region))
+        label_clusters.append(mask)
 
     # Replace heuristic spreading with mathematically defined region placement.
-    # 1) Build candidate grid
-    step = max(0.01, float(grid_step))  # grid step in axis units
-    xs_grid = [x_range[0] + step * i for i in range(int((x_range[1] - x_range[0]) / step) + 1)]
-    ys_grid = [y_range[0] + step * j for j in range(int((y_range[1] - y_range[0]) / step) + 1)]
-
-    def in_circle(px: float, py: float, cxy: Tuple[float, float]) -> float:
-        dx = px - cxy[0]
-        dy = py - cxy[1]
-        return (dx * dx + dy * dy) ** 0.5
-
-    # 2) Precompute candidate points per region key
-    region_to_points: Dict[FrozenSet[str], List[Tuple[float, float, float]]] = {}
-    all_types_set = {"Numeric", "Sequence", "Categorical", "Date"}
-    for ky in set(label_clusters):
-        included = list(ky)
-        excluded = list(all_types_set - set(ky))
-        candidates: List[Tuple[float, float, float]] = []
-        for px in xs_grid:
-            for py in ys_grid:
-                # inside all included
-                inside = True
-                min_in_margin = float("inf")
-                for t in included:
-                    d = in_circle(px, py, centers[t])
-                    if d > radius:
-                        inside = False
-                        break
-                    min_in_margin = min(min_in_margin, radius - d)
-                if not inside:
-                    continue
-                # outside all excluded
-                outside = True
-                min_out_margin = float("inf")
-                for t in excluded:
-                    d = in_circle(px, py, centers[t])
-                    if d < radius:
-                        outside = False
-                        break
-                    min_out_margin = min(min_out_margin, d - radius)
-                if not outside:
-                    continue
-                margin = min(min_in_margin, min_out_margin)
-                candidates.append((px, py, margin))
-        # sort by margin (prefer interior points)
-        candidates.sort(key=lambda p: p[2], reverse=True)
-        region_to_points[ky] = candidates
-
-    # 3) Greedy placement per region using candidate points
-    placed: List[Tuple[float, float, float, FrozenSet[str]]] = []  # (x,y,r,key)
-    new_labels: List[Tuple[str, float, float]] = [(t, 0.0, 0.0) for t, _, _ in labels]
-
-    def label_radius(text: str) -> float:
-        scale = max(0.5, min(2.0, font_size / 26.0))
-        return 0.12 * scale + 0.007 * len(text) * scale
-
-    # indices grouped by region size high -> low to fill central first
-    indices_by_key: Dict[FrozenSet[str], List[int]] = {}
-    for idx, key in enumerate(label_clusters):
-        indices_by_key.setdefault(key, []).append(idx)
-    ordered_keys = sorted(indices_by_key.keys(), key=lambda k: (-len(k), tuple(sorted(k))))
-
-    for key in ordered_keys:
-        idxs = indices_by_key[key]
-        candidates = region_to_points.get(key, [])
-        if not candidates:
-            # Fallback to previous anchor if region has no area (rare)
-            for i in idxs:
-                text, ax, ay = labels[i]
-                new_labels[i] = (text, ax, ay)
-                placed.append((ax, ay, label_radius(text)))
-            continue
-        # try to place labels greedily
-        for i in idxs:
-            text = labels[i][0]
-            r_need = label_radius(text)
-            chosen = None
-            best_score = -1e9
-            # Region-specific spacing. If explicit per-size spacing not provided
-            # (negative), fall back to global region_spacing scaled as before.
-            fallback = {
-                1: 0.40 * max(0.0, region_spacing),
-                2: 0.60 * max(0.0, region_spacing),
-                3: 0.75 * max(0.0, region_spacing),
-                4: 1.00 * max(0.0, region_spacing),
-            }
-            spacing_by_size = {
-                1: spacing_1way if spacing_1way >= 0.0 else fallback[1],
-                2: spacing_2way if spacing_2way >= 0.0 else fallback[2],
-                3: spacing_3way if spacing_3way >= 0.0 else fallback[3],
-                4: spacing_4way if spacing_4way >= 0.0 else fallback[4],
-            }
-            same_region_extra = spacing_by_size.get(len(key), fallback[2])
-
-            for (px, py, margin) in candidates:
-                # compute distance to existing placed labels
-                ok = True
-                min_dist = float("inf")
-                for (qx, qy, qr, qkey) in placed:
-                    d = ((px - qx) ** 2 + (py - qy) ** 2) ** 0.5
-                    req = qr + r_need
-                    if qkey == key:
-                        req += same_region_extra
-                    min_dist = min(min_dist, d - req)
-                    if d < req:
-                        ok = False
-                        break
-                if not ok:
-                    continue
-                # ensure the label disk fits fully in region by margin
-                if margin < (r_need + float(region_padding)):
-                    continue
-                score = margin + 0.5 * min_dist
-                if score > best_score:
-                    best_score = score
-                    chosen = (px, py)
-            if chosen is None:
-                # relax constraint: take top-margin candidate even if overlaps slightly
-                px, py, _ = candidates[0]
-                new_labels[i] = (text, px, py)
-                placed.append((px, py, r_need, key))
-            else:
-                px, py = chosen
-                new_labels[i] = (text, px, py)
-                placed.append((px, py, r_need, key))
+    # 1-2) Candidate points per region key, shared with the Matplotlib backend.
+    region_to_points = _compute_region_candidates(
+        float(grid_step),
+        radius,
+        tuple(sorted((name, cx, cy) for name, (cx, cy) in centers.items())),
+        frozenset(label_clusters),
+    )
 
-    labels = new_labels
+    # 3) Greedy placement per region using candidate points.
+    labels = _place_labels(
+        labels,
+        label_clusters,
+        radii,
+        region_to_points,
+        _spacing_by_size(region_spacing, spacing_1way, spacing_2way, spacing_3way, spacing_4way),
+        region_padding,
+    )
 
     # Styled annotations: bold text, white rounded box, stroke colored by region
-    color_by_type = {
-        "Numeric": colors["Numeric"],
-        "Sequence": colors["Sequence"],
-        "Categorical": colors["Categorical"],
-        "Date": colors["Date"],
-    }
+    annotations = []
     for (text, x, y), key in zip(labels, label_clusters):
-        region_colors = [_hex_to_rgb(color_by_type[t]) for t in key]
-        hex_colors = [color_by_type[t] for t in key]
-        border_color = _blend_colors(hex_colors)
-        fig.add_annotation(
-            x=x,
-            y=y,
-            text=f"<b>{text}</b>",
-            showarrow=False,
-            xref="x",
-            yref="y",
-            font=dict(size=font_size, color=border_color),
-            align="center",
-            bgcolor="#ffffff",
-            bordercolor=border_color,
-            borderwidth=2,
-            borderpad=4,
+        border_color = _blend_colors(_mask_names(key))
+        annotations.append(
+            dict(
+                x=x,
+                y=y,
+                text=f"<b>{text}</b>",
+                showarrow=False,
+                xref="x",
+                yref="y",
+                font=dict(size=font_size, color=border_color),
+                align="center",
+                bgcolor="#ffffff",
+                bordercolor=border_color,
+                borderwidth=2,
+                borderpad=4,
+            )
+        )
+
+    # Corner badges for the circle names
+    badge_font = max(int(font_size * 0.9), 18)
+    for name, bx, by in _BADGES:
+        annotations.append(
+            dict(
+                text=f"<b>{name}</b>",
+                x=bx,
+                y=by,
+                xref="paper",
+                yref="paper",
+                showarrow=False,
+                font=dict(color="#ffffff", size=badge_font),
+                bgcolor=_COLORS[name],
+                bordercolor=_COLORS[name],
+                borderwidth=2,
+                borderpad=6,
+                align="center",
+            )
         )
 
-    # Axis and layout styling for publication-quality output
+    # Axis and layout styling for publication-quality output; shapes and
+    # annotations go in with the rest of the layout in a single update.
+    fig = go.Figure()
     fig.update_xaxes(
         visible=False,
         range=x_range,
@@ -492,75 +663,19 @@ def create_concurrent_circles_figure(
         scaleratio=1,
     )
     fig.update_yaxes(visible=False, range=y_range, constrain="range")
-
-    # Corner badges for the circle names
-    badge_font = max(int(font_size * 0.9), 18)
     fig.update_layout(
         width=width,
         height=height,
         margin=dict(l=40, r=40, t=40, b=40),
         paper_bgcolor="#ffffff",
         plot_bgcolor="#ffffff",
-        annotations=[
-            # Top badges swapped to match left/right semantics
-            dict(
-                text="<b>Numeric</b>",
-                x=0.08,
-                y=0.95,
-                xref="paper",
-                yref="paper",
-                showarrow=False,
-                font=dict(color="#ffffff", size=badge_font),
-                bgcolor=colors["Numeric"],
-                bordercolor=colors["Numeric"],
-                borderpad=6,
-                align="center",
-            ),
-            dict(
-                text="<b>Sequence</b>",
-                x=0.92,
-                y=0.95,
-                xref="paper",
-                yref="paper",
-                showarrow=False,
-                font=dict(color="#ffffff", size=badge_font),
-                bgcolor=colors["Sequence"],
-                bordercolor=colors["Sequence"],
-                borderpad=6,
-                align="center",
-            ),
-            dict(
-                text="<b>Categorical</b>",
-                x=0.92,
-                y=0.06,
-                xref="paper",
-                yref="paper",
-                showarrow=False,
-                font=dict(color="#ffffff", size=badge_font),
-                bgcolor=colors["Categorical"],
-                bordercolor=colors["Categorical"],
-                borderpad=6,
-                align="center",
-            ),
-            dict(
-                text="<b>Date</b>",
-                x=0.08,
-                y=0.06,
-                xref="paper",
-                yref="paper",
-                showarrow=False,
-                font=dict(color="#ffffff", size=badge_font),
-                bgcolor=colors["Date"],
-                bordercolor=colors["Date"],
-                borderpad=6,
-                align="center",
-            ),
-        ],
+        shapes=shapes,
+        annotations=annotations,
     )
 
     return fig
 
 
-__all__ = ["create_concurrent_circles_figure"]
+__all__ = ["create_concurrent_circles_figure", "clear_cache"]
 
 
@@ -4,38 +4,58 @@ import numpy as np
 settings = ["Comp. Setting 1", "Comp. Setting 2", "Comp. Setting 3", "Comp. Setting 4", "Comp. Setting 5", "Comp. Setting 6", "Comp. Setting 7"]
 skill_A_names = ["Skill A: Gcd", "Skill A: Polygon Rotation", "Skill A: Circle", "Skill A: Prob No Fixed", "Skill A: Prob No Fixed", "Skill A: Polygon Color", "Skill A: Grid Chip"]
 skill_B_names = ["Skill B: Polynomial Roots", "Skill B: Pattern Matching", "Skill B: Func Intersection", "Skill B: Func Intersection", "Skill B: Matrix Rank", "Skill B: Prob No Fixed", "Skill B: Prob No Fixed"]
-zero_shot_A = [33, 6, 13, 5, 5, 24, 4]
-finetuned_A = [61, 22, 39, 22, 25, 50, 48]
-zero_shot_B = [5, 13, 21, 20, 19, 5, 18]
-finetuned_B = [37, 82, 70, 68, 75, 25, 22]
-zero_shot_AB = [10, 5, 30, 6, 30, 0, 1]
-finetuned_AB = [10, 20, 30, 6, 38, 0, 3]
+zero_shot_A = np.array([33, 6, 13, 5, 5, 24, 4])
+finetuned_A = np.array([61, 22, 39, 22, 25, 50, 48])
+zero_shot_B = np.array([5, 13, 21, 20, 19, 5, 18])
+finetuned_B = np.array([37, 82, 70, 68, 75, 25, 22])
+zero_shot_AB = np.array([10, 5, 30, 6, 30, 0, 1])
+finetuned_AB = np.array([10, 20, 30, 6, 38, 0, 3])
 
 x_offsets = [-0.15, 0, 0.15]  # Skill A, B, A+B at each setting
 x_base = np.arange(len(settings)) * 0.6  # Reduce spacing between settings
 
 fig = go.Figure()
 
-# Draw bars in order for legend grouping
-fig.add_bar(x=x_base + x_offsets[0], y=zero_shot_A, name='Before RL - Skill A (ID)', marker_color='blue', width=0.15, legendgroup='Before RL')
-fig.add_bar(x=x_base + x_offsets[1], y=zero_shot_B, name='Before RL - Skill B (ID)', marker_color='green', width=0.15, legendgroup='Before RL')
-fig.add_bar(x=x_base + x_offsets[2], y=zero_shot_AB, name='Before RL - Skill A+B (OOD)', marker_color='orange', width=0.15, legendgroup='Before RL')
+# Draw bars in order for legend grouping: (values, offset, name, color, opacity, group)
+bars = [
+    (zero_shot_A, x_offsets[0], 'Before RL - Skill A (ID)', 'blue', None, 'Before RL'),
+    (zero_shot_B, x_offsets[1], 'Before RL - Skill B (ID)', 'green', None, 'Before RL'),
+    (zero_shot_AB, x_offsets[2], 'Before RL - Skill A+B (OOD)', 'orange', None, 'Before RL'),
+    (finetuned_A, x_offsets[0], 'After RL - Skill A (ID)', 'lightblue', 0.5, 'After RL'),
+    (finetuned_B, x_offsets[1], 'After RL - Skill B (ID)', 'lightgreen', 0.5, 'After RL'),
+    (finetuned_AB, x_offsets[2], 'After RL - Skill A+B (OOD)', 'lightsalmon', 0.5, 'After RL'),
+]
+for values, offset, name, color, opacity, group in bars:
+    fig.add_bar(x=x_base + offset, y=values, name=name, marker_color=color, opacity=opacity, width=0.15, legendgroup=group)
 
-fig.add_bar(x=x_base + x_offsets[0], y=finetuned_A, name='After RL - Skill A (ID)', marker_color='lightblue', opacity=0.5, width=0.15, legendgroup='After RL')
-fig.add_bar(x=x_base + x_offsets[1], y=finetuned_B, name='After RL - Skill B (ID)', marker_color='lightgreen', opacity=0.5, width=0.15, legendgroup='After RL')
-fig.add_bar(x=x_base + x_offsets[2], y=finetuned_AB, name='After RL - Skill A+B (OOD)', marker_color='lightsalmon', opacity=0.5, width=0.15, legendgroup='After RL')
-
-# Annotate improvements
-for i in range(len(settings)):
-    # Annotations for zero-shot values (below the bars)
-    fig.add_annotation(x=x_base[i] + x_offsets[0], y=zero_shot_A[i] - 5, text=f'{zero_shot_A[i]}', font=dict(color='blue', size=10, weight='bold'), showarrow=False)
-    fig.add_annotation(x=x_base[i] + x_offsets[1], y=zero_shot_B[i] - 5, text=f'{zero_shot_B[i]}', font=dict(color='green', size=10, weight='bold'), showarrow=False)
-    fig.add_annotation(x=x_base[i] + x_offsets[2], y=zero_shot_AB[i] - 5, text=f'{zero_shot_AB[i]}', font=dict(color='orange', size=10, weight='bold'), showarrow=False)
-    
-    # Annotations for finetuned values (above the bars)
-    fig.add_annotation(x=x_base[i] + x_offsets[0], y=finetuned_A[i] + 3, text=f'{finetuned_A[i]} (+{finetuned_A[i]-zero_shot_A[i]})', font=dict(color='black', size=10, weight='bold'), showarrow=False)
-    fig.add_annotation(x=x_base[i] + x_offsets[1], y=finetuned_B[i] + 3, text=f'{finetuned_B[i]} (+{finetuned_B[i]-zero_shot_B[i]})', font=dict(color='black', size=10, weight='bold'), showarrow=False)
-    fig.add_annotation(x=x_base[i] + x_offsets[2], y=finetuned_AB[i] + 3, text=f'{finetuned_AB[i]} (+{finetuned_AB[i]-zero_shot_AB[i]})', font=dict(color='black', size=10, weight='bold'), showarrow=False)
+# Annotate improvements: one text trace for the zero-shot values (below the
+# bars) and one for the finetuned values with their gains (above the bars).
+# Text is left unclipped, since small zero-shot scores put their label below
+# the y-axis floor of 0.
+x_text = np.concatenate([x_base + offset for offset in x_offsets])
+zero_shot = np.concatenate([zero_shot_A, zero_shot_B, zero_shot_AB])
+finetuned = np.concatenate([finetuned_A, finetuned_B, finetuned_AB])
+gain = finetuned - zero_shot
+fig.add_scatter(
+    x=x_text,
+    y=zero_shot - 5,
+    text=[f'{v}' for v in zero_shot],
+    mode='text',
+    textfont=dict(color=[c for c in ('blue', 'green', 'orange') for _ in settings], size=10, weight='bold'),
+    showlegend=False,
+    hoverinfo='skip',
+    cliponaxis=False,
+)
+fig.add_scatter(
+    x=x_text,
+    y=finetuned + 3,
+    text=[f'{f} (+{g})' for f, g in zip(finetuned, gain)],
+    mode='text',
+    textfont=dict(color='black', size=10, weight='bold'),
+    showlegend=False,
+    hoverinfo='skip',
+    cliponaxis=False,
+)
 
 fig.update_layout(
     barmode='overlay',  # Overlay bars of the same skill
@@ -73,4 +93,4 @@ fig.update_layout(
     )
 )
 
-fig.write_html("grouped_bars.html")
+fig.write_html("grouped_bars.html", include_plotlyjs="cdn")
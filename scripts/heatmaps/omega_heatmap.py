@@ -1,7 +1,5 @@
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-import pandas as pd
 
 # Example data structure based on your heatmap
 data = np.array([
@@ -22,11 +20,24 @@ rows = [
 cols = ["Level 1", "Level 2", "Level 3", "Level 4", "Level 5"]
 
 fig, ax = plt.subplots(figsize=(8,6))
-sns.heatmap(
-    data, annot=True, fmt=".2f", cmap="RdYlGn", linewidths=2,
-    xticklabels=cols, yticklabels=rows, cbar_kws={'label': ''},
-    ax=ax, vmin=0, vmax=1, annot_kws={'weight': 'bold'}
-)
+im = ax.imshow(data, cmap="RdYlGn", vmin=0, vmax=1, aspect="auto")
+fig.colorbar(im, ax=ax, label='').outline.set_visible(False)
+ax.set_xticks(range(len(cols)), cols)
+ax.set_yticks(range(len(rows)), rows)
+# White cell borders, as in a seaborn heatmap with linewidths=2
+ax.set_xticks(np.arange(len(cols) + 1) - 0.5, minor=True)
+ax.set_yticks(np.arange(len(rows) + 1) - 0.5, minor=True)
+ax.grid(which="minor", color="white", linewidth=2)
+ax.tick_params(which="minor", length=0)
+ax.spines[:].set_visible(False)
+# Annotate each cell, dark text on light cells and white text on dark ones
+rgb = im.cmap(im.norm(data))[..., :3]
+rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+luminance = rgb @ [0.2126, 0.7152, 0.0722]
+for i in range(data.shape[0]):
+    for j in range(data.shape[1]):
+        ax.text(j, i, f"{data[i, j]:.2f}", ha="center", va="center", fontweight="bold",
+                color=".15" if luminance[i, j] > 0.408 else "w")
 ax.set_title("Problem: Arithmetic GCD", fontweight='bold', fontsize=16, pad=15)
 ax.set_xlabel("Complexity level of Test Problems", fontsize=12, fontweight='bold')
 ax.set_ylabel("", fontweight='bold')
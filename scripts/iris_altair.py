@@ -1,7 +1,8 @@
-import altair as alt
-from vega_datasets import data
-
 def main(output_path="iris_scatter.html"):
+    # Imported here so that importing this module stays cheap
+    import altair as alt
+    from vega_datasets import data
+
     iris = data.iris()
     chart = (
         alt.Chart(iris)
@@ -25,19 +25,32 @@ def plot_brier_long_run():
     # Expected Scores for Two Strategies
     # ==========================================
     # Diverse Errors: E[Score] = 2p - p² (collision only when correct)
-    diverse_score = 2*probs - probs**2
+    diverse_score = probs * (2 - probs)
     
     # Concentrated Errors: E[Score] = 2p - (p² + (1-p)²) (collision on wrong too)
-    concentrated_score = 2*probs - (probs**2 + (1-probs)**2)
+    # which simplifies to 1 - 2(1-p)²
+    concentrated_score = 1 - 2 * (1 - probs)**2
 
     # ==========================================
     # Add Fill Between (Overconfidence Penalty)
     # ==========================================
+    # Invisible lower boundary, filled up to by the next trace
     fig.add_trace(
         go.Scatter(
-            x=np.concatenate([probs, probs[::-1]]),
-            y=np.concatenate([diverse_score, concentrated_score[::-1]]),
-            fill='toself',
+            x=probs,
+            y=concentrated_score,
+            mode='lines',
+            line=dict(color='rgba(255,255,255,0)'),
+            showlegend=False,
+            hoverinfo='skip'
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=probs,
+            y=diverse_score,
+            mode='lines',
+            fill='tonexty',
             fillcolor='rgba(231, 76, 60, 0.15)',
             line=dict(color='rgba(255,255,255,0)'),
             name='<b>Overconfidence Penalty</b>',
@@ -143,7 +156,7 @@ def plot_brier_long_run():
 
     # Save output
     output_file = "brier_score.html"
-    fig.write_html(output_file)
+    fig.write_html(output_file, include_plotlyjs="cdn")
     print(f"Plot saved to {output_file}")
     
     # Print the markdown table for the blog
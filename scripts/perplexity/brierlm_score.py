@@ -24,10 +24,11 @@ def plot_brierlm_long_run():
     # Expected Brier Scores (per token, -1 to +1)
     # ==========================================
     # Diverse Errors: E[Score] = 2p - p²
-    diverse_brier = 2*probs - probs**2
+    diverse_brier = probs * (2 - probs)
     
     # Concentrated Errors: E[Score] = 2p - (p² + (1-p)²)
-    concentrated_brier = 2*probs - (probs**2 + (1-probs)**2)
+    # which simplifies to 1 - 2(1-p)²
+    concentrated_brier = 1 - 2 * (1 - probs)**2
 
     # ==========================================
     # Scale to BrierLM (0-100)
@@ -40,11 +41,23 @@ def plot_brierlm_long_run():
     # ==========================================
     # Add Fill Between (Overconfidence Penalty Region)
     # ==========================================
+    # Invisible lower boundary, filled up to by the next trace
     fig.add_trace(
         go.Scatter(
-            x=np.concatenate([probs, probs[::-1]]),
-            y=np.concatenate([diverse_brierlm, concentrated_brierlm[::-1]]),
-            fill='toself',
+            x=probs,
+            y=concentrated_brierlm,
+            mode='lines',
+            line=dict(color='rgba(255,255,255,0)'),
+            showlegend=False,
+            hoverinfo='skip'
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=probs,
+            y=diverse_brierlm,
+            mode='lines',
+            fill='tonexty',
             fillcolor='rgba(231, 76, 60, 0.15)',
             line=dict(color='rgba(255,255,255,0)'),
             name='<b>Overconfidence Penalty</b>',
@@ -171,7 +184,7 @@ def plot_brierlm_long_run():
 
     # Save output
     output_file = "brierlm_score.html"
-    fig.write_html(output_file)
+    fig.write_html(output_file, include_plotlyjs="cdn")
     print(f"Plot saved to {output_file}")
     
     print("\n--- Caption for Blog ---")
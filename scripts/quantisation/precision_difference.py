@@ -1,71 +1,83 @@
 import numpy as np
-from sklearn.decomposition import PCA
 import plotly.graph_objects as go
 
+
+def _quantize_numpy(arr, levels):
+    # Snap each value down to the nearest of `levels` evenly spaced bins
+    # strictly below it (the lowest bin for the minimum). The bins are
+    # uniform, so the index is plain arithmetic rather than a digitize
+    # binary search. One quantized copy of `arr` is stacked per entry of
+    # `levels`, all in a single broadcast pass.
+    levels = levels[:, None, None]
+    min_val, max_val = arr.min(), arr.max()
+    step = (max_val - min_val) / (levels - 1)
+    inds = np.ceil((arr - min_val) / step) - 1
+    quantized = min_val + np.clip(inds, 0, levels - 2) * step
+    return quantized
+
+
 def plot_quantization_multiple_steps(n_points, initial_precision, precisions_list):
     np.random.seed(42)
     dim = 10
-    data = np.random.uniform(low=-1, high=1, size=(n_points, dim))
-
-    def quantize(arr, levels):
-        min_val, max_val = arr.min(), arr.max()
-        bins = np.linspace(min_val, max_val, levels)
-        inds = np.digitize(arr, bins, right=True) - 1
-        quantized = bins[np.clip(inds, 0, levels - 1)]
-        return quantized
+    # float32 is ample for a 2-D projection and halves the memory traffic
+    data = np.random.uniform(low=-1, high=1, size=(n_points, dim)).astype(np.float32)
 
-    # Initial precision data
-    data_initial = quantize(data, initial_precision)
+    # Quantize to the initial and each lower precision in one pass
+    levels = np.array([initial_precision, *precisions_list], dtype=data.dtype)
+    quantized = _quantize_numpy(data, levels)
 
-    # Quantize to each lower precision in the list
-    quantized_sets = []
-    for prec in precisions_list:
-        quantized_sets.append(quantize(data, prec))
-
-    # Concatenate for PCA
-    data_concat = np.concatenate([data_initial] + quantized_sets)
-    pca = PCA(n_components=2)
-    pca_result = pca.fit_transform(data_concat)
+    # PCA of all sets at once (already stacked contiguously, so a reshaped
+    # view): the top two eigenvectors of the 10 x 10 Gram matrix of the
+    # centered data, each signed so its largest entry is positive
+    # (scikit-learn's convention) to keep the plot's orientation stable
+    stacked = quantized.reshape(-1, dim)
+    centered = stacked - stacked.mean(axis=0)
+    _, eigvecs = np.linalg.eigh(centered.T @ centered)
+    components = eigvecs[:, :-3:-1]
+    components *= np.sign(components[np.abs(components).argmax(axis=0), [0, 1]])
+    pca_result = centered @ components
 
     # Recover locations for each set
-    initial_2d = pca_result[:n_points]
-    other_2d = []
-    start_idx = n_points
-    for _ in precisions_list:
-        other_2d.append(pca_result[start_idx:start_idx + n_points])
-        start_idx += n_points
+    initial_2d, *other_2d = pca_result.reshape(len(quantized), n_points, 2)
 
-    fig = go.Figure()
+    # Traces are collected as plain dicts and validated once, together with
+    # the layout, when the figure is built
+    traces = []
     # Pick colors for each precision step
     colors = ['red', 'orange', 'green', 'purple', 'brown']
 
-    # Draw all lines first (so they appear behind points)
+    # Draw all lines first (so they appear behind points), one trace per
+    # precision whose segments are separated by NaN gaps
     for i, (prec, points_2d) in enumerate(zip(precisions_list, other_2d)):
         color = colors[i % len(colors)]
-        for j in range(n_points):
-            fig.add_trace(go.Scatter(
-                x=[initial_2d[j, 0], points_2d[j, 0]],
-                y=[initial_2d[j, 1], points_2d[j, 1]],
-                mode='lines', line=dict(color=color, width=4), showlegend=False
-            ))
+        segments = np.full((n_points, 3, 2), np.nan, dtype=pca_result.dtype)
+        segments[:, 0] = initial_2d
+        segments[:, 1] = points_2d
+        traces.append(dict(
+            type='scattergl',
+            x=segments[..., 0].ravel(), y=segments[..., 1].ravel(),
+            mode='lines', line=dict(color=color, width=4), showlegend=False
+        ))
 
-    # Draw initial precision points
-    fig.add_trace(go.Scatter(
+    # Draw initial precision points (legend names are bolded with HTML tags)
+    traces.append(dict(
+        type='scattergl',
         x=initial_2d[:, 0], y=initial_2d[:, 1], mode='markers',
         marker=dict(color='blue', size=10, opacity=0.85, line=dict(width=3, color='black')),
-        name=f'Initial Precision ({initial_precision} bits)'
+        name=f'<b>Initial Precision ({initial_precision} bits)</b>'
     ))
 
     # Draw quantized points for each precision
     for i, (prec, points_2d) in enumerate(zip(precisions_list, other_2d)):
         color = colors[i % len(colors)]
-        fig.add_trace(go.Scatter(
+        traces.append(dict(
+            type='scattergl',
             x=points_2d[:, 0], y=points_2d[:, 1], mode='markers',
             marker=dict(color=color, size=10, opacity=0.85, line=dict(width=3, color='black')),
-            name=f'Precision {prec} bits'
+            name=f'<b>Precision {prec} bits</b>'
         ))
 
-    fig.update_layout(
+    fig = go.Figure(data=traces, layout=dict(
         title=dict(
             text=f'<b>Parameter Quantization: Initial and Multiple Lower Precisions',
             font=dict(size=38, family='Arial', color='black'),
@@ -101,12 +113,9 @@ def plot_quantization_multiple_steps(n_points, initial_precision, precisions_lis
             orientation='v',
             title_font=dict(size=30, family='Arial', color='black', weight='bold')
         )
-    )
-    # Make legend text bold using HTML tags
-    for trace in fig.data:
-        if hasattr(trace, 'name') and trace.name:
-            trace.name = f'<b>{trace.name}</b>'
-    fig.write_html("quantization_plot.html")
+    ))
+    fig.write_html("quantization_plot.html", include_plotlyjs="cdn")
 
-# Example usage:
-plot_quantization_multiple_steps(n_points=4, initial_precision=64, precisions_list=[32, 16, 8, 4])
+if __name__ == "__main__":
+    # Example usage:
+    plot_quantization_multiple_steps(n_points=4, initial_precision=64, precisions_list=[32, 16, 8, 4])